@@ -4,11 +4,12 @@ Example configuration and usage of the Alpaca adapter with NautilusTrader.
 
 import asyncio
 import os
-from decimal import Decimal
 
 from src.adapters.alpaca_adapter.config import AlpacaDataClientConfig
 from src.adapters.alpaca_adapter.config import AlpacaExecClientConfig
 from src.adapters.alpaca_adapter.factories import AlpacaInstrumentProviderFactory
+from src.modes.runtime import use_uvloop
+from src.modes.runtime import wait_for_shutdown
 from nautilus_trader.config import InstrumentProviderConfig
 from nautilus_trader.config import LiveDataClientConfig
 from nautilus_trader.config import LiveExecClientConfig
@@ -26,6 +27,7 @@ from nautilus_trader.model.events import PositionOpened
 from nautilus_trader.model.events import PositionClosed
 from nautilus_trader.model.orders import MarketOrder
 from nautilus_trader.model.enums import OrderSide
+from nautilus_trader.model.objects import Price
 from nautilus_trader.model.objects import Quantity
 
 
@@ -45,6 +47,7 @@ class SimpleAlpacaStrategy(Strategy):
         # Strategy parameters
         self.instrument_id = InstrumentId(Symbol("AAPL"), Venue("ALPACA"))
         self.trade_size = Quantity.from_int(1)  # 1 share
+        self.max_spread_raw = Price.from_str("0.10").raw  # Fixed-point raw units
         
         # State tracking
         self.position_count = 0
@@ -83,10 +86,8 @@ class SimpleAlpacaStrategy(Strategy):
         
         # Simple trading logic: buy if we don't have max positions
         if self.position_count < self.max_positions:
-            spread = tick.ask_price - tick.bid_price
-            
-            # Only trade if spread is reasonable (less than $0.10)
-            if spread.as_decimal() < Decimal("0.10"):
+            # Only trade if spread is reasonable (less than $0.10), compared on raw integers
+            if tick.ask_price.raw - tick.bid_price.raw < self.max_spread_raw:
                 self._place_market_order(OrderSide.BUY)
     
     def on_position_opened(self, event: PositionOpened) -> None:
@@ -197,10 +198,7 @@ async def main():
         print("Press Ctrl+C to stop...")
         
         # Keep running until interrupted
-        while True:
-            await asyncio.sleep(1)
-            
-    except KeyboardInterrupt:
+        await wait_for_shutdown()
         print("Shutting down...")
     finally:
         await node.stop()
@@ -264,8 +262,13 @@ if __name__ == "__main__":
     # os.environ["ALPACA_API_KEY"] = "your_api_key_here"
     # os.environ["ALPACA_API_SECRET"] = "your_api_secret_here"
     
-    # Run the live trading example
-    asyncio.run(main())
+    # Run the live trading example (on uvloop when it is installed)
+    use_uvloop()
+    try:
+        asyncio.run(main())
+    except KeyboardInterrupt:
+        # Windows: Ctrl+C cancels main(), whose finally block still stops the node
+        print("Shutting down...")
     
     # Or run backtesting (commented out)
     # backtest_config = create_backtest_config()
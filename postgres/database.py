@@ -1,25 +1,43 @@
 """
 PostgreSQL database abstraction layer
 """
+import io
 import psycopg2
+import psycopg2.extensions
 import psycopg2.extras
+import psycopg2.pool
+from psycopg2 import sql
 import pandas as pd
-from typing import Optional, Dict, Any, List
+import pyarrow as pa
+import pyarrow.csv as pa_csv
+from typing import Optional, Dict, Any, List, Set, Tuple
 import logging
 import os
+import threading
 from contextlib import contextmanager
 
 logger = logging.getLogger(__name__)
 
+# Statements that invalidate the cached table listing
+DDL_PREFIXES = ('CREATE', 'DROP', 'ALTER')
+
 class PostgresDB:
     """PostgreSQL database connection and operations"""
     
+    # Process-wide connection pools keyed by connection parameters and pool size,
+    # each paired with a semaphore that makes callers wait for a free connection
+    _pools: Dict[tuple, Tuple[psycopg2.pool.ThreadedConnectionPool, threading.BoundedSemaphore]] = {}
+    _pools_lock = threading.Lock()
+    
     def __init__(self, 
                  host: str = None,
                  port: int = None,
                  database: str = None,
                  user: str = None,
-                 password: str = None):
+                 password: str = None,
+                 connect_timeout: int = None,
+                 min_connections: int = None,
+                 max_connections: int = None):
         
         # Use environment variables with defaults
         self.host = host or os.getenv('POSTGRES_HOST', 'localhost')
@@ -27,75 +45,207 @@ class PostgresDB:
         self.database = database or os.getenv('POSTGRES_DB', 'trading_data')
         self.user = user or os.getenv('POSTGRES_USER', 'postgres')
         self.password = password or os.getenv('POSTGRES_PASSWORD', 'postgres')
+        # Numeric settings use explicit None checks: 0 is meaningful (no timeout, empty pool)
+        self.connect_timeout = (connect_timeout if connect_timeout is not None
+                                else int(os.getenv('POSTGRES_CONNECT_TIMEOUT', 5)))
         
         self.connection_params = {
             'host': self.host,
             'port': self.port,
             'database': self.database,
             'user': self.user,
-            'password': self.password
+            'password': self.password,
+            # Fail fast instead of stalling the premarket window on an unreachable server
+            'connect_timeout': self.connect_timeout
         }
+        
+        self.min_connections = (min_connections if min_connections is not None
+                                else int(os.getenv('POSTGRES_POOL_MIN', 1)))
+        self.max_connections = (max_connections if max_connections is not None
+                                else int(os.getenv('POSTGRES_POOL_MAX', 10)))
+        
+        # Table names in the current schema, loaded lazily by table_exists
+        self._table_cache: Optional[Set[str]] = None
+        
+        # Connection pinned by an open transaction() on the current thread
+        self._local = threading.local()
+    
+    def _get_pool(self) -> Tuple[psycopg2.pool.ThreadedConnectionPool, threading.BoundedSemaphore]:
+        """Return the shared connection pool and its slot semaphore, creating them on first use"""
+        key = (tuple(sorted(self.connection_params.items())),
+               self.min_connections, self.max_connections)
+        entry = self._pools.get(key)
+        if entry is None:
+            with self._pools_lock:
+                entry = self._pools.get(key)
+                if entry is None:
+                    pool = psycopg2.pool.ThreadedConnectionPool(
+                        self.min_connections,
+                        self.max_connections,
+                        **self.connection_params
+                    )
+                    entry = (pool, threading.BoundedSemaphore(self.max_connections))
+                    self._pools[key] = entry
+        return entry
     
     @contextmanager
     def get_connection(self):
-        """Context manager for database connections"""
+        """Context manager for pooled database connections"""
+        # Join an enclosing transaction(); it commits once when it exits
+        active = getattr(self._local, 'conn', None)
+        if active is not None:
+            yield active
+            return
+        
+        pool, slots = self._get_pool()
         conn = None
+        # getconn() raises PoolError when every connection is checked out; wait instead
+        slots.acquire()
         try:
-            conn = psycopg2.connect(**self.connection_params)
+            conn = pool.getconn()
             yield conn
             conn.commit()
         except Exception as e:
-            if conn:
+            if conn and not conn.closed:
                 conn.rollback()
             logger.error(f"Database error: {e}")
             raise
         finally:
             if conn:
-                conn.close()
+                pool.putconn(conn, close=conn.closed != 0)
+            slots.release()
+    
+    @contextmanager
+    def transaction(self, synchronous_commit: bool = True):
+        """Run several operations on one connection and commit them together"""
+        if getattr(self._local, 'conn', None) is not None:
+            yield self._local.conn
+            return
+        
+        with self.get_connection() as conn:
+            if not synchronous_commit:
+                # Skip waiting on the WAL flush for data that can be regenerated
+                conn.cursor().execute("SET LOCAL synchronous_commit = off")
+            self._local.conn = conn
+            try:
+                yield conn
+            finally:
+                self._local.conn = None
+    
+    @classmethod
+    def close_all(cls) -> None:
+        """Close every pooled connection held by this process"""
+        with cls._pools_lock:
+            for pool, _ in cls._pools.values():
+                pool.closeall()
+            cls._pools.clear()
     
     def execute_query(self, query: str, params: Optional[tuple] = None) -> List[Dict]:
         """Execute a SELECT query and return results"""
         with self.get_connection() as conn:
-            cursor = conn.cursor(cursor_factory=psycopg2.extras.RealDictCursor)
+            cursor = conn.cursor()
             cursor.execute(query, params)
-            return [dict(row) for row in cursor.fetchall()]
+            columns = [column.name for column in cursor.description]
+            return [dict(zip(columns, row)) for row in cursor.fetchall()]
     
     def execute_command(self, command: str, params: Optional[tuple] = None) -> int:
         """Execute an INSERT/UPDATE/DELETE command and return affected rows"""
         with self.get_connection() as conn:
             cursor = conn.cursor()
             cursor.execute(command, params)
-            return cursor.rowcount
+            rowcount = cursor.rowcount
+        
+        # Schema changes may add or drop tables
+        if command.lstrip().upper().startswith(DDL_PREFIXES):
+            self._table_cache = None
+        return rowcount
+    
+    def execute_many(self, command: str, rows: List[tuple], page_size: int = 1000) -> int:
+        """Execute an INSERT ... VALUES %s command for many rows using execute_values"""
+        if not rows:
+            return 0
+        
+        with self.get_connection() as conn:
+            cursor = conn.cursor()
+            psycopg2.extras.execute_values(cursor, command, rows, page_size=page_size)
+            return len(rows)
     
     def insert_dataframe(self, df: pd.DataFrame, table_name: str, 
                         if_exists: str = 'append') -> int:
-        """Insert pandas DataFrame into PostgreSQL table"""
+        """Bulk load pandas DataFrame into an existing PostgreSQL table via COPY
+        
+        The table must already exist. if_exists='replace' TRUNCATEs it before
+        loading, keeping its schema, rather than dropping and recreating it.
+        """
         if df.empty:
             return 0
         
+        # Serialize once and stream through COPY instead of multi-row INSERTs.
+        # Arrow encodes columns in C; pandas handles object columns Arrow can't type.
+        try:
+            arrow_table = pa.Table.from_pandas(df, preserve_index=False)
+            buffer = io.BytesIO()
+            pa_csv.write_csv(arrow_table, buffer, pa_csv.WriteOptions(include_header=False))
+            null_marker = ''
+        except (pa.ArrowInvalid, pa.ArrowTypeError):
+            buffer = io.StringIO()
+            df.to_csv(buffer, index=False, header=False, na_rep='\\N')
+            null_marker = '\\N'
+        buffer.seek(0)
+        
+        # Quote identifiers so mixed-case or spaced column names load as-is
+        target = sql.Identifier(*table_name.split('.'))
+        copy_sql = sql.SQL("COPY {} ({}) FROM STDIN WITH CSV NULL {}").format(
+            target,
+            sql.SQL(', ').join(sql.Identifier(str(column)) for column in df.columns),
+            sql.Literal(null_marker)
+        )
+        
         with self.get_connection() as conn:
-            # Use pandas to_sql with PostgreSQL engine
-            rows_inserted = df.to_sql(
-                table_name, 
-                conn, 
-                if_exists=if_exists,
-                index=False,
-                method='multi'
-            )
-            return len(df) if rows_inserted is None else rows_inserted
+            cursor = conn.cursor()
+            if if_exists == 'replace':
+                cursor.execute(sql.SQL("TRUNCATE TABLE {}").format(target))
+            elif if_exists != 'append':
+                raise ValueError(f"Unsupported if_exists value: {if_exists}")
+            cursor.copy_expert(copy_sql.as_string(conn), buffer)
+            return len(df)
     
-    def read_sql(self, query: str, params: Optional[tuple] = None) -> pd.DataFrame:
-        """Execute query and return pandas DataFrame"""
+    def read_sql(self, query: str, params: Optional[tuple] = None,
+                 parse_dates: Optional[List[str]] = None) -> pd.DataFrame:
+        """Execute query and return pandas DataFrame streamed via COPY TO STDOUT
+        
+        Values round-trip through CSV text, so column types are inferred by
+        pandas rather than taken from the cursor: NULLs (and empty strings)
+        become NaN, booleans are read from 't'/'f', numerics become int/float
+        (never Decimal), timestamps stay strings unless listed in parse_dates,
+        and arrays/JSON come back as their text form.
+        """
+        buffer = io.StringIO()
+        
         with self.get_connection() as conn:
-            return pd.read_sql_query(query, conn, params=params)
+            cursor = conn.cursor()
+            # COPY does not accept bind parameters, so inline them client-side
+            bound_query = cursor.mogrify(query, params).decode(psycopg2.extensions.encodings[conn.encoding])
+            cursor.copy_expert(f"COPY ({bound_query.strip().rstrip(';')}) TO STDOUT WITH CSV HEADER", buffer)
+        
+        buffer.seek(0)
+        # COPY writes NULL as an empty field; keep text like 'NA' or 'N/A' intact
+        return pd.read_csv(buffer, parse_dates=parse_dates,
+                           keep_default_na=False, na_values=[''],
+                           true_values=['t'], false_values=['f'])
     
-    def table_exists(self, table_name: str) -> bool:
+    def _fetch_tables(self) -> Set[str]:
+        """Load all table names in the current schema with a single query"""
+        if self._table_cache is None:
+            query = """
+                SELECT table_name FROM information_schema.tables
+                WHERE table_schema = current_schema()
+            """
+            self._table_cache = {row['table_name'] for row in self.execute_query(query)}
+        return self._table_cache
+    
+    def table_exists(self, table_name: str, refresh: bool = False) -> bool:
         """Check if table exists"""
-        query = """
-            SELECT EXISTS (
-                SELECT 1 FROM information_schema.tables 
-                WHERE table_name = %s
-            )
-        """
-        result = self.execute_query(query, (table_name,))
-        return result[0]['exists']
\ No newline at end of file
+        if refresh:
+            self._table_cache = None
+        return table_name in self._fetch_tables()
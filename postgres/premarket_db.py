@@ -8,6 +8,19 @@ import logging
 
 logger = logging.getLogger(__name__)
 
+# Columns written by save_scan_results, in table order; scan_date/scan_time come first
+SCAN_COLUMNS = [
+    'scan_date', 'scan_time', 'ticker', 'company_name', 'current_price', 'previous_close',
+    'gap_percent', 'current_volume', 'avg_volume_50d', 'relative_volume',
+    'shares_outstanding', 'float_shares', 'float_display', 'sector', 'market_cap', 'news_catalyst'
+]
+
+# NOT NULL columns save_scan_results needs from the frame (scan timestamps are bound)
+REQUIRED_SCAN_COLUMNS = ['ticker', 'current_price', 'previous_close', 'gap_percent', 'current_volume']
+
+# Timestamp columns that need re-typing when scans are read back through COPY
+SCAN_DATE_COLUMNS = ['scan_date', 'scan_time', 'created_at']
+
 class PremarketDB(PostgresDB):
     """Database operations specific to premarket scanner"""
     
@@ -45,6 +58,7 @@ class PremarketDB(PostgresDB):
         CREATE INDEX IF NOT EXISTS idx_premarket_ticker ON premarket_scans(ticker);
         CREATE INDEX IF NOT EXISTS idx_premarket_gap_percent ON premarket_scans(gap_percent);
         CREATE INDEX IF NOT EXISTS idx_premarket_scan_time ON premarket_scans(scan_time);
+        CREATE INDEX IF NOT EXISTS idx_premarket_ticker_date ON premarket_scans(ticker, scan_date DESC);
         """
         
         try:
@@ -60,19 +74,26 @@ class PremarketDB(PostgresDB):
             logger.info("No scan results to save")
             return 0
         
-        # Prepare dataframe for insertion
-        results_df = results_df.copy()
-        results_df['scan_date'] = scan_time.date()
-        results_df['scan_time'] = scan_time
+        # Scan timestamps are bound as parameters, so COPY only the frame's own columns
+        frame_columns = [column for column in SCAN_COLUMNS[2:] if column in results_df.columns]
+        missing = [column for column in REQUIRED_SCAN_COLUMNS if column not in frame_columns]
+        if missing:
+            raise ValueError(f"Scan results are missing required columns: {missing}")
+        column_list = ', '.join(frame_columns)
         
         try:
-            # Handle conflicts by updating existing records
-            insert_sql = """
-            INSERT INTO premarket_scans 
-            (scan_date, scan_time, ticker, company_name, current_price, previous_close,
-             gap_percent, current_volume, avg_volume_50d, relative_volume, 
-             shares_outstanding, float_shares, float_display, sector, market_cap, news_catalyst)
-            VALUES %s
+            # Stage the whole scan with COPY, then upsert it in one set-based statement.
+            # DISTINCT ON keeps a duplicate ticker within the batch from failing the upsert;
+            # ordering by ctid DESC keeps the ticker's last row as loaded by COPY.
+            staging_sql = f"""
+            CREATE TEMP TABLE premarket_scans_staging ON COMMIT DROP AS
+            SELECT {column_list} FROM premarket_scans WITH NO DATA
+            """
+            upsert_sql = f"""
+            INSERT INTO premarket_scans (scan_date, scan_time, {column_list})
+            SELECT DISTINCT ON (ticker) %s, %s, {column_list}
+            FROM premarket_scans_staging
+            ORDER BY ticker, ctid DESC
             ON CONFLICT (scan_date, scan_time, ticker) 
             DO UPDATE SET
                 current_price = EXCLUDED.current_price,
@@ -81,8 +102,11 @@ class PremarketDB(PostgresDB):
                 relative_volume = EXCLUDED.relative_volume
             """
             
-            # Use insert_dataframe for simplicity, handling conflicts at application level
-            rows_inserted = self.insert_dataframe(results_df, 'premarket_scans', if_exists='append')
+            # Scan results can be regenerated, so don't block on the WAL flush
+            with self.transaction(synchronous_commit=False):
+                self.execute_command(staging_sql)
+                self.insert_dataframe(results_df[frame_columns], 'premarket_scans_staging')
+                rows_inserted = self.execute_command(upsert_sql, (scan_time.date(), scan_time))
             logger.info(f"Saved {rows_inserted} premarket scan records")
             return rows_inserted
             
@@ -97,22 +121,22 @@ class PremarketDB(PostgresDB):
         WHERE scan_date = %s 
         ORDER BY scan_time DESC, gap_percent DESC
         """
-        return self.read_sql(query, (date.today(),))
+        return self.read_sql(query, (date.today(),), parse_dates=SCAN_DATE_COLUMNS)
     
     def get_historical_scans(self, days_back: int = 30) -> pd.DataFrame:
         """Get historical premarket scans"""
         query = """
         SELECT * FROM premarket_scans 
-        WHERE scan_date >= CURRENT_DATE - INTERVAL '%s days'
+        WHERE scan_date >= CURRENT_DATE - make_interval(days => %s)
         ORDER BY scan_date DESC, gap_percent DESC
         """
-        return self.read_sql(query, (days_back,))
+        return self.read_sql(query, (int(days_back),), parse_dates=SCAN_DATE_COLUMNS)
     
     def get_ticker_history(self, ticker: str, days_back: int = 7) -> pd.DataFrame:
         """Get scan history for specific ticker"""
         query = """
         SELECT * FROM premarket_scans 
-        WHERE ticker = %s AND scan_date >= CURRENT_DATE - INTERVAL '%s days'
+        WHERE ticker = %s AND scan_date >= CURRENT_DATE - make_interval(days => %s)
         ORDER BY scan_date DESC, scan_time DESC
         """
-        return self.read_sql(query, (ticker, days_back))
\ No newline at end of file
+        return self.read_sql(query, (ticker, int(days_back)), parse_dates=SCAN_DATE_COLUMNS)
\ No newline at end of file
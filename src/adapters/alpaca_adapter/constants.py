@@ -0,0 +1,12 @@
+"""
+Constants for the Alpaca adapter.
+"""
+
+from nautilus_trader.model.identifiers import Venue
+
+
+ALPACA_VENUE = Venue("ALPACA")
+
+# US equities are quoted in cents and traded in whole shares
+ALPACA_PRICE_PRECISION = 2
+ALPACA_SIZE_PRECISION = 0
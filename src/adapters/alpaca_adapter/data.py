@@ -12,6 +12,8 @@ from alpaca.data.models import Quote, Trade, Bar
 from alpaca.data.enums import DataFeed
 
 from alpaca_adapter.config import AlpacaDataClientConfig
+from alpaca_adapter.constants import ALPACA_PRICE_PRECISION
+from alpaca_adapter.constants import ALPACA_VENUE
 from nautilus_trader.common.enums import LogColor
 from nautilus_trader.core.correctness import PyCondition
 from nautilus_trader.live.data_client import LiveMarketDataClient
@@ -23,7 +25,6 @@ from nautilus_trader.model.enums import BookType
 from nautilus_trader.model.identifiers import InstrumentId
 from nautilus_trader.model.identifiers import Symbol
 from nautilus_trader.model.identifiers import TradeId
-from nautilus_trader.model.identifiers import Venue
 from nautilus_trader.model.objects import Price
 from nautilus_trader.model.objects import Quantity
 
@@ -69,7 +70,7 @@ class AlpacaDataClient(LiveMarketDataClient):
         )
         
         self._config = config
-        self._venue = Venue("ALPACA")
+        self._venue = ALPACA_VENUE
         
         # Initialize Alpaca clients
         self._data_client = StockHistoricalDataClient(
@@ -85,47 +86,44 @@ class AlpacaDataClient(LiveMarketDataClient):
             feed=DataFeed.IEX if config.data_feed == "iex" else DataFeed.SIP,
         )
         
-        # Subscription tracking
+        # Instrument IDs interned by raw symbol for the tick parsing hot path
+        self._instrument_ids: dict[str, InstrumentId] = {}
+        
+        # Subscription tracking, keyed by raw symbol. Quote ticks and book deltas
+        # share one Alpaca quote stream, so each consumer is tracked separately.
         self._subscribed_quotes: set[str] = set()
+        self._subscribed_quote_ticks: set[str] = set()
+        self._subscribed_book_deltas: set[str] = set()
         self._subscribed_trades: set[str] = set()
         self._subscribed_bars: set[str] = set()
-        
-        self._setup_stream_handlers()
     
-    def _setup_stream_handlers(self) -> None:
-        """Set up data stream event handlers."""
-        
-        async def quote_data_handler(data: Quote) -> None:
-            """Handle incoming quote data."""
-            try:
-                quote_tick = self._parse_quote_tick(data)
-                if quote_tick:
-                    self._handle_data(quote_tick)
-            except Exception as e:
-                self._log.error(f"Error processing quote data: {e}")
-        
-        async def trade_data_handler(data: Trade) -> None:
-            """Handle incoming trade data."""
-            try:
-                trade_tick = self._parse_trade_tick(data)
-                if trade_tick:
-                    self._handle_data(trade_tick)
-            except Exception as e:
-                self._log.error(f"Error processing trade data: {e}")
-        
-        async def bar_data_handler(data: Bar) -> None:
-            """Handle incoming bar data."""
-            try:
-                bar = self._parse_bar(data)
-                if bar:
-                    self._handle_data(bar)
-            except Exception as e:
-                self._log.error(f"Error processing bar data: {e}")
-        
-        # Assign handlers
-        self._stream._quote_handler = quote_data_handler
-        self._stream._trade_handler = trade_data_handler
-        self._stream._bar_handler = bar_data_handler
+    # Stream callbacks
+    async def _on_stream_quote(self, data: Quote) -> None:
+        """Handle incoming quote data."""
+        try:
+            quote_tick = self._parse_quote_tick(data)
+            if quote_tick:
+                self._handle_data(quote_tick)
+        except Exception as e:
+            self._log.error(f"Error processing quote data: {e}")
+    
+    async def _on_stream_trade(self, data: Trade) -> None:
+        """Handle incoming trade data."""
+        try:
+            trade_tick = self._parse_trade_tick(data)
+            if trade_tick:
+                self._handle_data(trade_tick)
+        except Exception as e:
+            self._log.error(f"Error processing trade data: {e}")
+    
+    async def _on_stream_bar(self, data: Bar) -> None:
+        """Handle incoming bar data."""
+        try:
+            bar = self._parse_bar(data)
+            if bar:
+                self._handle_data(bar)
+        except Exception as e:
+            self._log.error(f"Error processing bar data: {e}")
     
     @property
     def subscribed_instruments(self) -> list[InstrumentId]:
@@ -135,10 +133,15 @@ class AlpacaDataClient(LiveMarketDataClient):
         symbols.update(self._subscribed_trades)
         symbols.update(self._subscribed_bars)
         
-        return [
-            InstrumentId(Symbol(symbol), self._venue) 
-            for symbol in symbols
-        ]
+        return [self._instrument_id(symbol) for symbol in symbols]
+    
+    def _instrument_id(self, symbol: str) -> InstrumentId:
+        """Return the interned instrument ID for a raw Alpaca symbol."""
+        instrument_id = self._instrument_ids.get(symbol)
+        if instrument_id is None:
+            instrument_id = InstrumentId(Symbol(symbol), self._venue)
+            self._instrument_ids[symbol] = instrument_id
+        return instrument_id
     
     # Connection management
     async def _connect(self) -> None:
@@ -169,6 +172,8 @@ class AlpacaDataClient(LiveMarketDataClient):
     def reset(self) -> None:
         """Reset the data client state."""
         self._subscribed_quotes.clear()
+        self._subscribed_quote_ticks.clear()
+        self._subscribed_book_deltas.clear()
         self._subscribed_trades.clear()
         self._subscribed_bars.clear()
     
@@ -181,6 +186,20 @@ class AlpacaDataClient(LiveMarketDataClient):
             self._stream = None
     
     # Subscription methods
+    def _acquire_quote_stream(self, symbol: str) -> None:
+        """Subscribe to the Alpaca quote stream for a symbol if not already streaming."""
+        if symbol not in self._subscribed_quotes:
+            self._stream.subscribe_quotes(self._on_stream_quote, symbol)
+            self._subscribed_quotes.add(symbol)
+    
+    def _release_quote_stream(self, symbol: str) -> None:
+        """Unsubscribe the Alpaca quote stream once no quote consumer needs it."""
+        if symbol in self._subscribed_quote_ticks or symbol in self._subscribed_book_deltas:
+            return
+        if symbol in self._subscribed_quotes:
+            self._stream.unsubscribe_quotes(symbol)
+            self._subscribed_quotes.discard(symbol)
+    
     async def _subscribe_instruments(self) -> None:
         """Subscribe to instrument status updates."""
         # Alpaca doesn't provide general instrument status updates
@@ -208,9 +227,10 @@ class AlpacaDataClient(LiveMarketDataClient):
         symbol = instrument_id.symbol.value
         
         # Subscribe to quotes (which provide best bid/ask)
-        if symbol not in self._subscribed_quotes:
-            self._stream.subscribe_quotes(self._quote_handler, symbol)
-            self._subscribed_quotes.add(symbol)
+        if symbol not in self._subscribed_book_deltas:
+            self._instrument_ids.setdefault(symbol, instrument_id)
+            self._subscribed_book_deltas.add(symbol)
+            self._acquire_quote_stream(symbol)
             
             self._log.info(
                 f"Subscribed to order book deltas for {symbol}",
@@ -221,9 +241,9 @@ class AlpacaDataClient(LiveMarketDataClient):
         """Unsubscribe from order book delta updates for an instrument."""
         symbol = instrument_id.symbol.value
         
-        if symbol in self._subscribed_quotes:
-            self._stream.unsubscribe_quotes(symbol)
-            self._subscribed_quotes.discard(symbol)
+        if symbol in self._subscribed_book_deltas:
+            self._subscribed_book_deltas.discard(symbol)
+            self._release_quote_stream(symbol)
             
             self._log.info(f"Unsubscribed from order book deltas for {symbol}")
     
@@ -231,9 +251,10 @@ class AlpacaDataClient(LiveMarketDataClient):
         """Subscribe to quote tick updates for an instrument."""
         symbol = instrument_id.symbol.value
         
-        if symbol not in self._subscribed_quotes:
-            self._stream.subscribe_quotes(self._quote_handler, symbol)
-            self._subscribed_quotes.add(symbol)
+        if symbol not in self._subscribed_quote_ticks:
+            self._instrument_ids.setdefault(symbol, instrument_id)
+            self._subscribed_quote_ticks.add(symbol)
+            self._acquire_quote_stream(symbol)
             
             self._log.info(f"Subscribed to quotes for {symbol}", LogColor.BLUE)
     
@@ -241,9 +262,9 @@ class AlpacaDataClient(LiveMarketDataClient):
         """Unsubscribe from quote tick updates for an instrument."""
         symbol = instrument_id.symbol.value
         
-        if symbol in self._subscribed_quotes:
-            self._stream.unsubscribe_quotes(symbol)
-            self._subscribed_quotes.discard(symbol)
+        if symbol in self._subscribed_quote_ticks:
+            self._subscribed_quote_ticks.discard(symbol)
+            self._release_quote_stream(symbol)
             
             self._log.info(f"Unsubscribed from quotes for {symbol}")
     
@@ -252,7 +273,8 @@ class AlpacaDataClient(LiveMarketDataClient):
         symbol = instrument_id.symbol.value
         
         if symbol not in self._subscribed_trades:
-            self._stream.subscribe_trades(self._trade_handler, symbol)
+            self._instrument_ids.setdefault(symbol, instrument_id)
+            self._stream.subscribe_trades(self._on_stream_trade, symbol)
             self._subscribed_trades.add(symbol)
             
             self._log.info(f"Subscribed to trades for {symbol}", LogColor.BLUE)
@@ -272,7 +294,8 @@ class AlpacaDataClient(LiveMarketDataClient):
         symbol = bar_type.instrument_id.symbol.value
         
         if symbol not in self._subscribed_bars:
-            self._stream.subscribe_bars(self._bar_handler, symbol)
+            self._instrument_ids.setdefault(symbol, bar_type.instrument_id)
+            self._stream.subscribe_bars(self._on_stream_bar, symbol)
             self._subscribed_bars.add(symbol)
             
             self._log.info(f"Subscribed to bars for {symbol}", LogColor.BLUE)
@@ -290,39 +313,37 @@ class AlpacaDataClient(LiveMarketDataClient):
     # Data parsing methods
     def _parse_quote_tick(self, data: Quote) -> QuoteTick | None:
         """Parse Alpaca quote data into a QuoteTick."""
-        try:
-            instrument_id = InstrumentId(Symbol(data.symbol), self._venue)
-            
-            return QuoteTick(
-                instrument_id=instrument_id,
-                bid_price=Price.from_str(str(data.bid_price)),
-                ask_price=Price.from_str(str(data.ask_price)),
-                bid_size=Quantity.from_int(data.bid_size or 0),
-                ask_size=Quantity.from_int(data.ask_size or 0),
-                ts_event=self._clock.timestamp_ns(),
-                ts_init=self._clock.timestamp_ns(),
-            )
-        except Exception as e:
-            self._log.error(f"Failed to parse quote tick: {e}")
+        if data.bid_price is None or data.ask_price is None:
+            self._log.debug(f"Dropping quote with missing prices for {data.symbol}")
             return None
+        
+        ts_init = self._clock.timestamp_ns()
+        return QuoteTick(
+            instrument_id=self._instrument_id(data.symbol),
+            bid_price=Price(data.bid_price, ALPACA_PRICE_PRECISION),
+            ask_price=Price(data.ask_price, ALPACA_PRICE_PRECISION),
+            bid_size=Quantity.from_int(data.bid_size or 0),
+            ask_size=Quantity.from_int(data.ask_size or 0),
+            ts_event=ts_init,
+            ts_init=ts_init,
+        )
     
     def _parse_trade_tick(self, data: Trade) -> TradeTick | None:
         """Parse Alpaca trade data into a TradeTick."""
-        try:
-            instrument_id = InstrumentId(Symbol(data.symbol), self._venue)
-            
-            return TradeTick(
-                instrument_id=instrument_id,
-                price=Price.from_str(str(data.price)),
-                size=Quantity.from_int(data.size),
-                aggressor_side=AggressorSide.NO_AGGRESSOR,  # Alpaca doesn't provide this
-                trade_id=TradeId(str(data.timestamp)),  # Use timestamp as trade ID
-                ts_event=self._clock.timestamp_ns(),
-                ts_init=self._clock.timestamp_ns(),
-            )
-        except Exception as e:
-            self._log.error(f"Failed to parse trade tick: {e}")
+        if data.price is None or data.size is None:
+            self._log.debug(f"Dropping trade with missing price or size for {data.symbol}")
             return None
+        
+        ts_init = self._clock.timestamp_ns()
+        return TradeTick(
+            instrument_id=self._instrument_id(data.symbol),
+            price=Price(data.price, ALPACA_PRICE_PRECISION),
+            size=Quantity.from_int(data.size),
+            aggressor_side=AggressorSide.NO_AGGRESSOR,  # Alpaca doesn't provide this
+            trade_id=TradeId(str(data.timestamp)),  # Use timestamp as trade ID
+            ts_event=ts_init,
+            ts_init=ts_init,
+        )
     
     def _parse_bar(self, data: Bar) -> Bar | None:
         """Parse Alpaca bar data into a Bar."""
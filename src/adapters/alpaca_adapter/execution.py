@@ -3,6 +3,7 @@ Alpaca execution client implementation.
 """
 
 import asyncio
+from collections import OrderedDict
 from decimal import Decimal
 from typing import Any
 from uuid import uuid4
@@ -14,6 +15,7 @@ from alpaca.trading.requests import MarketOrderRequest, LimitOrderRequest, StopO
 from alpaca.trading.stream import TradingStream
 
 from alpaca_adapter.config import AlpacaExecClientConfig
+from alpaca_adapter.constants import ALPACA_VENUE
 from nautilus_trader.common.enums import LogColor
 from nautilus_trader.core.correctness import PyCondition
 from nautilus_trader.core.uuid import UUID4
@@ -43,13 +45,74 @@ from nautilus_trader.model.identifiers import ClientOrderId
 from nautilus_trader.model.identifiers import InstrumentId
 from nautilus_trader.model.identifiers import Symbol
 from nautilus_trader.model.identifiers import TradeId
-from nautilus_trader.model.identifiers import Venue
 from nautilus_trader.model.identifiers import VenueOrderId
 from nautilus_trader.model.objects import Money
 from nautilus_trader.model.objects import Price
 from nautilus_trader.model.objects import Quantity
 
 
+# Nautilus -> Alpaca conversions used when submitting orders
+NAUTILUS_TO_ALPACA_SIDE = {
+    NautilusOrderSide.BUY: OrderSide.BUY,
+    NautilusOrderSide.SELL: OrderSide.SELL,
+}
+
+# Alpaca -> Nautilus conversions used when building reports
+ALPACA_TO_NAUTILUS_SIDE = {
+    OrderSide.BUY: NautilusOrderSide.BUY,
+    OrderSide.SELL: NautilusOrderSide.SELL,
+}
+
+ALPACA_TO_NAUTILUS_ORDER_TYPE = {
+    OrderType.MARKET: NautilusOrderType.MARKET,
+    OrderType.LIMIT: NautilusOrderType.LIMIT,
+    OrderType.STOP: NautilusOrderType.STOP_MARKET,
+    OrderType.STOP_LIMIT: NautilusOrderType.STOP_LIMIT,
+}
+
+ALPACA_TO_NAUTILUS_TIF = {
+    TimeInForce.DAY: NautilusTimeInForce.DAY,
+    TimeInForce.GTC: NautilusTimeInForce.GTC,
+    TimeInForce.IOC: NautilusTimeInForce.IOC,
+    TimeInForce.FOK: NautilusTimeInForce.FOK,
+}
+
+ALPACA_TO_NAUTILUS_STATUS = {
+    OrderStatus.NEW: NautilusOrderStatus.ACCEPTED,
+    OrderStatus.ACCEPTED: NautilusOrderStatus.ACCEPTED,
+    OrderStatus.PARTIALLY_FILLED: NautilusOrderStatus.PARTIALLY_FILLED,
+    OrderStatus.FILLED: NautilusOrderStatus.FILLED,
+    OrderStatus.CANCELED: NautilusOrderStatus.CANCELED,
+    OrderStatus.REJECTED: NautilusOrderStatus.REJECTED,
+    OrderStatus.EXPIRED: NautilusOrderStatus.EXPIRED,
+}
+
+# Alpaca statuses that mean the order is live on the venue
+ACCEPTED_ORDER_STATUSES = frozenset({OrderStatus.NEW, OrderStatus.ACCEPTED})
+
+NAUTILUS_TO_ALPACA_TIF = {
+    NautilusTimeInForce.DAY: TimeInForce.DAY,
+    NautilusTimeInForce.GTC: TimeInForce.GTC,
+    NautilusTimeInForce.IOC: TimeInForce.IOC,
+    NautilusTimeInForce.FOK: TimeInForce.FOK,
+}
+
+# Cancels in flight at once. This caps concurrency, not requests per minute, so it
+# does not by itself keep a large cancel-all under Alpaca's 200 requests/minute limit.
+MAX_CONCURRENT_CANCELS = 10
+
+# Client order IDs minted for orders placed outside this client, kept for reconciliation
+MAX_EXTERNAL_ORDER_IDS = 10_000
+
+# Alpaca request model for each supported Nautilus order type
+NAUTILUS_TO_ALPACA_ORDER_REQUEST = {
+    NautilusOrderType.MARKET: MarketOrderRequest,
+    NautilusOrderType.LIMIT: LimitOrderRequest,
+    NautilusOrderType.STOP_MARKET: StopOrderRequest,
+    NautilusOrderType.STOP_LIMIT: StopLimitOrderRequest,
+}
+
+
 class AlpacaExecutionClient(LiveExecutionClient):
     """
     Provides an execution client for Alpaca Markets.
@@ -95,7 +158,8 @@ class AlpacaExecutionClient(LiveExecutionClient):
         )
         
         self._config = config
-        self._venue = Venue("ALPACA")
+        self._venue = ALPACA_VENUE
+        self._account_id = AccountId(f"ALPACA-{config.api_key[:8]}")
         
         # Initialize Alpaca clients
         self._trading_client = TradingClient(
@@ -111,9 +175,16 @@ class AlpacaExecutionClient(LiveExecutionClient):
             raw_data=config.use_raw_data,
         )
         
-        # Order tracking
-        self._client_order_id_to_venue: dict[ClientOrderId, VenueOrderId] = {}
-        self._venue_order_id_to_client: dict[VenueOrderId, ClientOrderId] = {}
+        # Order tracking, keyed by raw ID strings so lookups hash plain str
+        self._venue_order_ids: dict[str, str] = {}  # client order ID -> venue order ID
+        self._client_order_ids: dict[str, str] = {}  # venue order ID -> client order ID
+        # Pairs are dropped when an order is cancelled. Fills are never untracked (trade
+        # updates are not processed yet), so filled orders still accumulate in both maps.
+        self._external_order_ids: OrderedDict[str, str] = OrderedDict()  # venue order ID -> minted client order ID
+        self._instrument_ids: dict[str, InstrumentId] = {}
+        
+        # Shared by every cancel path to cap how many cancel requests are in flight
+        self._cancel_semaphore = asyncio.Semaphore(MAX_CONCURRENT_CANCELS)
         
         self._setup_stream_handlers()
     
@@ -164,6 +235,54 @@ class AlpacaExecutionClient(LiveExecutionClient):
         except Exception as e:
             self._log.error(f"Error disconnecting from Alpaca trading APIs: {e}")
     
+    def _instrument_id(self, symbol: str) -> InstrumentId:
+        """Return the interned instrument ID for a raw Alpaca symbol."""
+        instrument_id = self._instrument_ids.get(symbol)
+        if instrument_id is None:
+            instrument_id = InstrumentId(Symbol(symbol), self._venue)
+            self._instrument_ids[symbol] = instrument_id
+        return instrument_id
+    
+    # Order ID tracking
+    def _track_order_ids(self, client_id: str, venue_id: str) -> None:
+        """Record a client/venue order ID pair in both lookup directions."""
+        self._venue_order_ids[client_id] = venue_id
+        self._client_order_ids[venue_id] = client_id
+    
+    def _untrack_order_ids(self, venue_id: str) -> None:
+        """Forget a closed order's ID pair so the tracking maps stay bounded."""
+        client_id = self._client_order_ids.pop(venue_id, None)
+        if client_id:
+            self._venue_order_ids.pop(client_id, None)
+    
+    def _get_venue_order_id(self, client_order_id: ClientOrderId) -> VenueOrderId | None:
+        """Return the venue order ID for a client order ID, if known."""
+        venue_id = self._venue_order_ids.get(client_order_id.value)
+        if venue_id:
+            return VenueOrderId(venue_id)
+        
+        # Fall back to the Nautilus cache for orders no longer tracked here
+        return self._cache.venue_order_id(client_order_id)
+    
+    def _get_client_order_id(self, venue_id: str) -> ClientOrderId | None:
+        """Return the client order ID for a venue order ID, if known."""
+        client_id = self._client_order_ids.get(venue_id)
+        if client_id:
+            return ClientOrderId(client_id)
+        
+        # Fall back to the Nautilus cache for orders no longer tracked here
+        return self._cache.client_order_id(VenueOrderId(venue_id))
+    
+    def _external_client_order_id(self, venue_id: str) -> ClientOrderId:
+        """Return a stable minted client order ID for an order placed outside this client."""
+        client_id = self._external_order_ids.get(venue_id)
+        if client_id is None:
+            client_id = str(uuid4())
+            self._external_order_ids[venue_id] = client_id
+            if len(self._external_order_ids) > MAX_EXTERNAL_ORDER_IDS:
+                self._external_order_ids.popitem(last=False)
+        return ClientOrderId(client_id)
+    
     # Order management
     async def _submit_order(self, command: SubmitOrder) -> None:
         """Submit an order to Alpaca."""
@@ -178,26 +297,30 @@ class AlpacaExecutionClient(LiveExecutionClient):
             )
             
             # Track order ID mapping
-            venue_order_id = VenueOrderId(str(alpaca_order.id))
-            self._client_order_id_to_venue[command.order.client_order_id] = venue_order_id
-            self._venue_order_id_to_client[venue_order_id] = command.order.client_order_id
+            order = command.order
+            venue_id = str(alpaca_order.id)
+            venue_order_id = VenueOrderId(venue_id)
+            self._track_order_ids(order.client_order_id.value, venue_id)
+            
+            # Both events come from the same venue response, so share one timestamp
+            ts_event = self._clock.timestamp_ns()
             
             # Generate OrderSubmitted event
             self._generate_order_submitted(
                 strategy_id=command.strategy_id,
-                instrument_id=command.order.instrument_id,
-                client_order_id=command.order.client_order_id,
-                ts_event=self._clock.timestamp_ns(),
+                instrument_id=order.instrument_id,
+                client_order_id=order.client_order_id,
+                ts_event=ts_event,
             )
             
             # Generate OrderAccepted event if order is immediately accepted
-            if alpaca_order.status in [OrderStatus.NEW, OrderStatus.ACCEPTED]:
+            if alpaca_order.status in ACCEPTED_ORDER_STATUSES:
                 self._generate_order_accepted(
                     strategy_id=command.strategy_id,
-                    instrument_id=command.order.instrument_id,
-                    client_order_id=command.order.client_order_id,
+                    instrument_id=order.instrument_id,
+                    client_order_id=order.client_order_id,
                     venue_order_id=venue_order_id,
-                    ts_event=self._clock.timestamp_ns(),
+                    ts_event=ts_event,
                 )
             
         except Exception as e:
@@ -215,7 +338,7 @@ class AlpacaExecutionClient(LiveExecutionClient):
     async def _modify_order(self, command: ModifyOrder) -> None:
         """Modify an existing order."""
         try:
-            venue_order_id = self._client_order_id_to_venue.get(command.client_order_id)
+            venue_order_id = self._get_venue_order_id(command.client_order_id)
             if not venue_order_id:
                 self._log.error(f"Cannot find venue order ID for {command.client_order_id}")
                 return
@@ -240,16 +363,13 @@ class AlpacaExecutionClient(LiveExecutionClient):
     async def _cancel_order(self, command: CancelOrder) -> None:
         """Cancel a specific order."""
         try:
-            venue_order_id = self._client_order_id_to_venue.get(command.client_order_id)
+            venue_order_id = self._get_venue_order_id(command.client_order_id)
             if not venue_order_id:
                 self._log.error(f"Cannot find venue order ID for {command.client_order_id}")
                 return
             
             # Cancel order
-            await self._loop.run_in_executor(
-                None,
-                lambda: self._trading_client.cancel_order_by_id(venue_order_id.value)
-            )
+            await self._cancel_venue_order(venue_order_id.value)
             
             # Generate OrderCanceled event
             self._generate_order_canceled(
@@ -259,6 +379,7 @@ class AlpacaExecutionClient(LiveExecutionClient):
                 venue_order_id=venue_order_id,
                 ts_event=self._clock.timestamp_ns(),
             )
+            self._untrack_order_ids(venue_order_id.value)
             
         except Exception as e:
             self._log.error(f"Failed to cancel order: {e}")
@@ -271,39 +392,51 @@ class AlpacaExecutionClient(LiveExecutionClient):
                 None,
                 lambda: self._trading_client.get_orders(
                     status="open",
-                    symbols=[command.instrument_id.symbol.value] if command.instrument_id else None
+                    symbols=[command.instrument_id.symbol.value],
                 )
             )
             
-            # Cancel each order
-            for order in open_orders:
-                try:
-                    await self._loop.run_in_executor(
-                        None,
-                        lambda: self._trading_client.cancel_order_by_id(order.id)
+            # Cancel all orders concurrently; failures come back as exceptions
+            results = await asyncio.gather(
+                *(self._cancel_venue_order(order.id) for order in open_orders),
+                return_exceptions=True,
+            )
+            
+            ts_event = self._clock.timestamp_ns()
+            for order, result in zip(open_orders, results):
+                if isinstance(result, Exception):
+                    self._log.error(f"Failed to cancel order {order.id}: {result}")
+                    continue
+                
+                # Generate OrderCanceled event
+                venue_id = str(order.id)
+                client_order_id = self._get_client_order_id(venue_id)
+                if client_order_id:
+                    self._generate_order_canceled(
+                        strategy_id=command.strategy_id,
+                        instrument_id=self._instrument_id(order.symbol),
+                        client_order_id=client_order_id,
+                        venue_order_id=VenueOrderId(venue_id),
+                        ts_event=ts_event,
                     )
-                    
-                    # Generate OrderCanceled event
-                    client_order_id = self._venue_order_id_to_client.get(VenueOrderId(str(order.id)))
-                    if client_order_id:
-                        self._generate_order_canceled(
-                            strategy_id=command.strategy_id,
-                            instrument_id=InstrumentId(Symbol(order.symbol), self._venue),
-                            client_order_id=client_order_id,
-                            venue_order_id=VenueOrderId(str(order.id)),
-                            ts_event=self._clock.timestamp_ns(),
-                        )
-                        
-                except Exception as order_error:
-                    self._log.error(f"Failed to cancel order {order.id}: {order_error}")
+                    self._untrack_order_ids(venue_id)
             
         except Exception as e:
             self._log.error(f"Failed to cancel all orders: {e}")
     
+    async def _cancel_venue_order(self, venue_order_id) -> None:
+        """Cancel an order at Alpaca, bounded by the shared cancel concurrency limit."""
+        async with self._cancel_semaphore:
+            await self._loop.run_in_executor(
+                None,
+                self._trading_client.cancel_order_by_id,
+                venue_order_id
+            )
+    
     async def _batch_cancel_orders(self, command: BatchCancelOrders) -> None:
         """Cancel a batch of orders."""
-        for cancel_order in command.cancels:
-            await self._cancel_order(cancel_order)
+        # Alpaca has no cancel-by-IDs endpoint, so issue the cancels concurrently
+        await asyncio.gather(*(self._cancel_order(cancel_order) for cancel_order in command.cancels))
     
     # Report generation
     async def generate_order_status_report(
@@ -317,10 +450,10 @@ class AlpacaExecutionClient(LiveExecutionClient):
             if venue_order_id:
                 order_id = venue_order_id.value
             elif client_order_id:
-                venue_id = self._client_order_id_to_venue.get(client_order_id)
-                if not venue_id:
+                tracked_id = self._get_venue_order_id(client_order_id)
+                if not tracked_id:
                     return None
-                order_id = venue_id.value
+                order_id = tracked_id.value
             else:
                 return None
             
@@ -361,7 +494,7 @@ class AlpacaExecutionClient(LiveExecutionClient):
             
             reports = []
             for order in orders:
-                instr_id = InstrumentId(Symbol(order.symbol), self._venue)
+                instr_id = self._instrument_id(order.symbol)
                 report = self._create_order_status_report(order, instr_id)
                 if report:
                     reports.append(report)
@@ -417,57 +550,30 @@ class AlpacaExecutionClient(LiveExecutionClient):
     def _create_alpaca_order_request(self, order) -> Any:
         """Create an Alpaca order request from a Nautilus order."""
         symbol = order.instrument_id.symbol.value
-        side = OrderSide.BUY if order.side == NautilusOrderSide.BUY else OrderSide.SELL
+        side = NAUTILUS_TO_ALPACA_SIDE.get(order.side, OrderSide.SELL)
         qty = int(order.quantity.as_decimal())
         
         # Convert time in force
-        tif_map = {
-            NautilusTimeInForce.DAY: TimeInForce.DAY,
-            NautilusTimeInForce.GTC: TimeInForce.GTC,
-            NautilusTimeInForce.IOC: TimeInForce.IOC,
-            NautilusTimeInForce.FOK: TimeInForce.FOK,
-        }
-        time_in_force = tif_map.get(order.time_in_force, TimeInForce.DAY)
-        
-        # Create appropriate order request based on order type
-        if order.order_type == NautilusOrderType.MARKET:
-            return MarketOrderRequest(
-                symbol=symbol,
-                side=side,
-                qty=qty,
-                time_in_force=time_in_force,
-            )
-        
-        elif order.order_type == NautilusOrderType.LIMIT:
-            return LimitOrderRequest(
-                symbol=symbol,
-                side=side,
-                qty=qty,
-                limit_price=float(order.price.as_decimal()),
-                time_in_force=time_in_force,
-            )
+        time_in_force = NAUTILUS_TO_ALPACA_TIF.get(order.time_in_force, TimeInForce.DAY)
         
-        elif order.order_type == NautilusOrderType.STOP_MARKET:
-            return StopOrderRequest(
-                symbol=symbol,
-                side=side,
-                qty=qty,
-                stop_price=float(order.trigger_price.as_decimal()),
-                time_in_force=time_in_force,
-            )
+        # Look up the request model for the order type
+        request_type = NAUTILUS_TO_ALPACA_ORDER_REQUEST.get(order.order_type)
+        if request_type is None:
+            raise ValueError(f"Unsupported order type: {order.order_type}")
         
-        elif order.order_type == NautilusOrderType.STOP_LIMIT:
-            return StopLimitOrderRequest(
-                symbol=symbol,
-                side=side,
-                qty=qty,
-                limit_price=float(order.price.as_decimal()),
-                stop_price=float(order.trigger_price.as_decimal()),
-                time_in_force=time_in_force,
-            )
+        prices = {}
+        if order.has_price:
+            prices["limit_price"] = order.price.as_double()
+        if order.has_trigger_price:
+            prices["stop_price"] = order.trigger_price.as_double()
         
-        else:
-            raise ValueError(f"Unsupported order type: {order.order_type}")
+        return request_type(
+            symbol=symbol,
+            side=side,
+            qty=qty,
+            time_in_force=time_in_force,
+            **prices,
+        )
     
     def _create_modify_request(self, command: ModifyOrder) -> Any:
         """Create a modify request from a ModifyOrder command."""
@@ -479,87 +585,73 @@ class AlpacaExecutionClient(LiveExecutionClient):
     def _create_order_status_report(self, alpaca_order: AlpacaOrder, instrument_id: InstrumentId) -> OrderStatusReport | None:
         """Create an order status report from an Alpaca order."""
         try:
-            # Map Alpaca order status to Nautilus status
-            status_map = {
-                OrderStatus.NEW: NautilusOrderStatus.ACCEPTED,
-                OrderStatus.ACCEPTED: NautilusOrderStatus.ACCEPTED,
-                OrderStatus.PARTIALLY_FILLED: NautilusOrderStatus.PARTIALLY_FILLED,
-                OrderStatus.FILLED: NautilusOrderStatus.FILLED,
-                OrderStatus.CANCELED: NautilusOrderStatus.CANCELED,
-                OrderStatus.REJECTED: NautilusOrderStatus.REJECTED,
-                OrderStatus.EXPIRED: NautilusOrderStatus.EXPIRED,
-            }
-            
-            venue_order_id = VenueOrderId(str(alpaca_order.id))
-            client_order_id = self._venue_order_id_to_client.get(venue_order_id)
-            
-            if not client_order_id:
-                # Generate a new client order ID for orders not tracked
-                client_order_id = ClientOrderId(str(uuid4()))
-                self._venue_order_id_to_client[venue_order_id] = client_order_id
-                self._client_order_id_to_venue[client_order_id] = venue_order_id
+            venue_id = str(alpaca_order.id)
+            venue_order_id = VenueOrderId(venue_id)
+            client_order_id = self._get_client_order_id(venue_id)
+            
+            if client_order_id is None:
+                # Orders not submitted through this client get a minted ID
+                client_order_id = self._external_client_order_id(venue_id)
+            
+            ts_now = self._clock.timestamp_ns()
             
             return OrderStatusReport(
-                account_id=AccountId(f"ALPACA-{self._config.api_key[:8]}"),
+                account_id=self._account_id,
                 instrument_id=instrument_id,
                 client_order_id=client_order_id,
                 venue_order_id=venue_order_id,
-                order_side=NautilusOrderSide.BUY if alpaca_order.side == OrderSide.BUY else NautilusOrderSide.SELL,
-                order_type=self._map_order_type(alpaca_order.order_type),
-                time_in_force=self._map_time_in_force(alpaca_order.time_in_force),
-                order_status=status_map.get(alpaca_order.status, NautilusOrderStatus.REJECTED),
+                order_side=ALPACA_TO_NAUTILUS_SIDE.get(alpaca_order.side, NautilusOrderSide.SELL),
+                order_type=ALPACA_TO_NAUTILUS_ORDER_TYPE.get(alpaca_order.order_type, NautilusOrderType.MARKET),
+                time_in_force=ALPACA_TO_NAUTILUS_TIF.get(alpaca_order.time_in_force, NautilusTimeInForce.DAY),
+                order_status=ALPACA_TO_NAUTILUS_STATUS.get(alpaca_order.status, NautilusOrderStatus.REJECTED),
                 quantity=Quantity.from_int(int(alpaca_order.qty)),
                 filled_qty=Quantity.from_int(int(alpaca_order.filled_qty or 0)),
-                price=Price.from_str(str(alpaca_order.limit_price)) if alpaca_order.limit_price else None,
+                price=self._parse_limit_price(alpaca_order.limit_price, instrument_id) if alpaca_order.limit_price else None,
+                # Volume-weighted fill price: keep every digit Alpaca reports
                 avg_px=Price.from_str(str(alpaca_order.filled_avg_price)) if alpaca_order.filled_avg_price else None,
                 report_id=UUID4(),
-                ts_accepted=self._clock.timestamp_ns(),
-                ts_last=self._clock.timestamp_ns(),
-                ts_init=self._clock.timestamp_ns(),
+                ts_accepted=ts_now,
+                ts_last=ts_now,
+                ts_init=ts_now,
             )
             
         except Exception as e:
             self._log.error(f"Failed to create order status report: {e}")
             return None
     
+    def _parse_limit_price(self, value, instrument_id: InstrumentId) -> Price:
+        """
+        Convert an Alpaca limit price at the cached instrument's declared precision.
+        
+        Provider-loaded equities declare ALPACA_PRICE_PRECISION (cents), so sub-dollar
+        limits Alpaca accepts at 4 decimals are rounded to cents here. Only uncached
+        instruments keep Alpaca's own digits via Price.from_str.
+        """
+        instrument = self._cache.instrument(instrument_id)
+        if instrument is None:
+            return Price.from_str(str(value))
+        return Price(float(value), instrument.price_precision)
+    
     def _create_position_status_report(self, alpaca_position) -> PositionStatusReport | None:
         """Create a position status report from an Alpaca position."""
         try:
+            ts_now = self._clock.timestamp_ns()
+            
             return PositionStatusReport(
-                account_id=AccountId(f"ALPACA-{self._config.api_key[:8]}"),
-                instrument_id=InstrumentId(Symbol(alpaca_position.symbol), self._venue),
+                account_id=self._account_id,
+                instrument_id=self._instrument_id(alpaca_position.symbol),
                 position_side=self._map_position_side(alpaca_position.side),
-                quantity=Quantity.from_str(str(abs(float(alpaca_position.qty)))),
+                quantity=Quantity.from_str(alpaca_position.qty.lstrip("-")),  # qty is a decimal string
                 signed_qty=float(alpaca_position.qty),
                 report_id=UUID4(),
-                ts_last=self._clock.timestamp_ns(),
-                ts_init=self._clock.timestamp_ns(),
+                ts_last=ts_now,
+                ts_init=ts_now,
             )
             
         except Exception as e:
             self._log.error(f"Failed to create position status report: {e}")
             return None
     
-    def _map_order_type(self, alpaca_order_type) -> NautilusOrderType:
-        """Map Alpaca order type to Nautilus order type."""
-        type_map = {
-            OrderType.MARKET: NautilusOrderType.MARKET,
-            OrderType.LIMIT: NautilusOrderType.LIMIT,
-            OrderType.STOP: NautilusOrderType.STOP_MARKET,
-            OrderType.STOP_LIMIT: NautilusOrderType.STOP_LIMIT,
-        }
-        return type_map.get(alpaca_order_type, NautilusOrderType.MARKET)
-    
-    def _map_time_in_force(self, alpaca_tif) -> NautilusTimeInForce:
-        """Map Alpaca time in force to Nautilus time in force."""
-        tif_map = {
-            TimeInForce.DAY: NautilusTimeInForce.DAY,
-            TimeInForce.GTC: NautilusTimeInForce.GTC,
-            TimeInForce.IOC: NautilusTimeInForce.IOC,
-            TimeInForce.FOK: NautilusTimeInForce.FOK,
-        }
-        return tif_map.get(alpaca_tif, NautilusTimeInForce.DAY)
-    
     def _map_position_side(self, alpaca_side) -> str:
         """Map Alpaca position side to Nautilus position side."""
         # This would need to be implemented based on Alpaca's position side values
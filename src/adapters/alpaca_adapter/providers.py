@@ -6,6 +6,9 @@ import asyncio
 from decimal import Decimal
 from typing import Any
 
+from alpaca_adapter.constants import ALPACA_PRICE_PRECISION
+from alpaca_adapter.constants import ALPACA_SIZE_PRECISION
+from alpaca_adapter.constants import ALPACA_VENUE
 from alpaca_adapter.data import StockHistoricalDataClient
 from alpaca.trading.client import TradingClient
 from alpaca.trading.enums import AssetClass
@@ -17,13 +20,22 @@ from nautilus_trader.model.currencies import USD
 from nautilus_trader.model.enums import AssetType
 from nautilus_trader.model.identifiers import InstrumentId
 from nautilus_trader.model.identifiers import Symbol
-from nautilus_trader.model.identifiers import Venue
 from nautilus_trader.model.instruments import Equity
 from nautilus_trader.model.objects import Money
 from nautilus_trader.model.objects import Price
 from nautilus_trader.model.objects import Quantity
 
 
+# Instrument fields shared by every Alpaca equity, built once at import
+EQUITY_PRICE_INCREMENT = Price.from_str("0.01")
+EQUITY_SIZE_INCREMENT = Quantity.from_int(1)
+EQUITY_MARGIN = Decimal("1.0")  # 100% margin requirement by default
+EQUITY_FEE = Decimal("0.0")  # Alpaca has no commission fees
+
+# Asset lookups in flight at once (a concurrency cap, not a per-minute rate limit)
+MAX_CONCURRENT_ASSET_REQUESTS = 10
+
+
 class AlpacaInstrumentProvider(InstrumentProvider):
     """
     Provides instrument definitions for Alpaca Markets.
@@ -44,7 +56,8 @@ class AlpacaInstrumentProvider(InstrumentProvider):
         super().__init__()
         self._client = client
         self._data_client = data_client
-        self._venue = Venue("ALPACA")
+        self._venue = ALPACA_VENUE
+        self._asset_semaphore = asyncio.Semaphore(MAX_CONCURRENT_ASSET_REQUESTS)
         
         # Add USD currency
         self.add_currency(currency=USD)
@@ -92,23 +105,28 @@ class AlpacaInstrumentProvider(InstrumentProvider):
         """
         symbols = [instrument_id.symbol.value for instrument_id in instrument_ids]
         
-        # Run blocking call in thread pool
+        # Fetch assets concurrently, at most MAX_CONCURRENT_ASSET_REQUESTS at a time
+        assets = await asyncio.gather(*(self._fetch_asset(symbol) for symbol in symbols))
+        
+        for asset in assets:
+            if asset and asset.tradable and asset.status == AssetStatus.ACTIVE:
+                instrument = self._parse_instrument(asset)
+                if instrument:
+                    self.add(instrument=instrument)
+    
+    async def _fetch_asset(self, symbol: str):
+        """Fetch a single Alpaca asset, returning None if the request fails."""
         loop = asyncio.get_event_loop()
         
-        for symbol in symbols:
-            try:
-                asset = await loop.run_in_executor(
+        try:
+            async with self._asset_semaphore:
+                return await loop.run_in_executor(
                     None,
-                    lambda s=symbol: self._client.get_asset(s)
+                    lambda: self._client.get_asset(symbol)
                 )
-                
-                if asset.tradable and asset.status == AssetStatus.ACTIVE:
-                    instrument = self._parse_instrument(asset)
-                    if instrument:
-                        self.add(instrument=instrument)
-                        
-            except Exception as e:
-                self._log.error(f"Failed to load instrument {symbol}: {e}")
+        except Exception as e:
+            self._log.error(f"Failed to load instrument {symbol}: {e}")
+            return None
     
     async def load_async(
         self, 
@@ -158,30 +176,40 @@ class AlpacaInstrumentProvider(InstrumentProvider):
         Equity or None
             The parsed instrument, or None if parsing failed.
         """
+        # Only US equities map onto the Equity instrument built below
+        if asset.asset_class != AssetClass.US_EQUITY:
+            return None
+        
+        if not asset.symbol:
+            self._log.warning(f"Skipping Alpaca asset {asset.id} with no symbol")
+            return None
+        
         try:
             symbol = Symbol(asset.symbol)
             instrument_id = InstrumentId(symbol=symbol, venue=self._venue)
+            ts_init = self._clock.timestamp_ns()
             
             # Create equity instrument
             return Equity(
                 instrument_id=instrument_id,
-                raw_symbol=Symbol(asset.symbol),
+                raw_symbol=symbol,
                 asset_type=AssetType.SPOT,
                 currency=USD,
-                price_precision=2,  # US equities typically 2 decimal places
-                size_precision=0,   # Shares are whole numbers
-                price_increment=Price.from_str("0.01"),
-                size_increment=Quantity.from_int(1),
-                lot_size=Quantity.from_int(1),
-                margin_init=Decimal("1.0"),  # 100% margin requirement by default
-                margin_maint=Decimal("1.0"),
-                maker_fee=Decimal("0.0"),  # Alpaca has no commission fees
-                taker_fee=Decimal("0.0"),
-                ts_event=self._clock.timestamp_ns(),
-                ts_init=self._clock.timestamp_ns(),
+                price_precision=ALPACA_PRICE_PRECISION,
+                size_precision=ALPACA_SIZE_PRECISION,
+                price_increment=EQUITY_PRICE_INCREMENT,
+                size_increment=EQUITY_SIZE_INCREMENT,
+                lot_size=EQUITY_SIZE_INCREMENT,
+                margin_init=EQUITY_MARGIN,
+                margin_maint=EQUITY_MARGIN,
+                maker_fee=EQUITY_FEE,
+                taker_fee=EQUITY_FEE,
+                ts_event=ts_init,
+                ts_init=ts_init,
                 info={"alpaca_asset": asset.__dict__},
             )
             
-        except Exception as e:
+        except (TypeError, ValueError) as e:
+            # Raised by Nautilus validation of symbol and instrument fields
             self._log.error(f"Failed to parse instrument {asset.symbol}: {e}")
             return None
\ No newline at end of file
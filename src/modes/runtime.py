@@ -0,0 +1,28 @@
+"""
+Process lifecycle helpers shared by the trading mode runners.
+"""
+
+import asyncio
+import signal
+
+
+async def wait_for_shutdown():
+    """Block until SIGINT/SIGTERM without waking the event loop in the meantime."""
+    stop_event = asyncio.Event()
+    loop = asyncio.get_running_loop()
+    for sig in (signal.SIGINT, signal.SIGTERM):
+        try:
+            loop.add_signal_handler(sig, stop_event.set)
+        except NotImplementedError:
+            # Windows: no loop signal handlers; callers catch KeyboardInterrupt from asyncio.run
+            pass
+    await stop_event.wait()
+
+
+def use_uvloop():
+    """Run the node's data and execution clients on uvloop when it is installed."""
+    try:
+        import uvloop
+    except ImportError:  # Optional: falls back to the default asyncio loop
+        return
+    asyncio.set_event_loop_policy(uvloop.EventLoopPolicy())
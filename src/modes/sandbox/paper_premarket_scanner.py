@@ -8,6 +8,8 @@ from src.adapters.alpaca_adapter import AlpacaDataClientConfig
 from src.adapters.alpaca_adapter import AlpacaExecClientConfig
 from src.adapters.alpaca_adapter import AlpacaLiveDataClientFactory
 from src.adapters.alpaca_adapter import AlpacaLiveExecClientFactory
+from src.modes.runtime import use_uvloop
+from src.modes.runtime import wait_for_shutdown
 from nautilus_trader.config import TradingNodeConfig, LoggingConfig
 from nautilus_trader.live.node import TradingNode
 
@@ -116,10 +118,7 @@ async def main():
         await paper_node.start()
         
         # Keep running
-        while True:
-            await asyncio.sleep(1)
-            
-    except KeyboardInterrupt:
+        await wait_for_shutdown()
         print("\n🛑 Shutdown requested...")
     except Exception as e:
         print(f"❌ Error: {e}")
@@ -128,4 +127,9 @@ async def main():
 
 
 if __name__ == "__main__":
-    asyncio.run(main())
\ No newline at end of file
+    use_uvloop()
+    try:
+        asyncio.run(main())
+    except KeyboardInterrupt:
+        # Windows: Ctrl+C cancels main(), whose finally block still stops the node
+        print("\n🛑 Shutdown requested...")
\ No newline at end of file
@@ -1,4 +1,5 @@
 import asyncio
+from functools import lru_cache
 from typing import Dict, List, Set, Optional
 from datetime import datetime, time, timedelta
 from decimal import Decimal
@@ -15,6 +16,12 @@ from nautilus_trader.config import StrategyConfig
 from nautilus_trader.common import Logger
 
 
+@lru_cache(maxsize=None)
+def _parse_session_time(value: str) -> time:
+    """Parse an HH:MM:SS config string once and reuse the result."""
+    return time.fromisoformat(value)
+
+
 class PremarketScannerConfig(StrategyConfig, frozen=True):
     """Configuration for Premarket Scanner Strategy."""
     
@@ -79,6 +86,10 @@ class PremarketScannerStrategy(Strategy):
         self.daily_pnl = Decimal("0.0")
         self.trade_count = 0
         
+        # Risk thresholds converted once rather than on every bar
+        self.position_value = Decimal(str(config.position_size_usd))
+        self.daily_loss_floor = -Decimal(str(config.daily_loss_limit_usd))
+        
         # Bar types for each symbol we're monitoring
         self.bar_types: Dict[str, BarType] = {}
         
@@ -170,7 +181,7 @@ class PremarketScannerStrategy(Strategy):
         self._update_indicators(bar, symbol)
         
         # Check for trading signals
-        if self.market_open and symbol in (self.gainers | self.losers):
+        if self.market_open and (symbol in self.gainers or symbol in self.losers):
             self._check_trading_signals(bar, symbol)
         
         # Update position management
@@ -250,7 +261,7 @@ class PremarketScannerStrategy(Strategy):
             return
         
         # Skip if daily loss limit reached
-        if self.daily_pnl <= -Decimal(str(self.config.daily_loss_limit_usd)):
+        if self.daily_pnl <= self.daily_loss_floor:
             self.log.warning("Daily loss limit reached, no new positions")
             return
         
@@ -310,8 +321,7 @@ class PremarketScannerStrategy(Strategy):
                 return
             
             # Calculate position size
-            position_value = Decimal(str(self.config.position_size_usd))
-            shares = int(position_value / Decimal(str(price)))
+            shares = int(self.position_value / Decimal(str(price)))
             quantity = instrument.make_qty(shares)
             
             # Create market order
@@ -344,8 +354,7 @@ class PremarketScannerStrategy(Strategy):
                 return
             
             # Calculate position size
-            position_value = Decimal(str(self.config.position_size_usd))
-            shares = int(position_value / Decimal(str(price)))
+            shares = int(self.position_value / Decimal(str(price)))
             quantity = instrument.make_qty(shares)
             
             # Create market order
@@ -432,14 +441,14 @@ class PremarketScannerStrategy(Strategy):
     
     def _is_premarket_time(self, current_time: time) -> bool:
         """Check if current time is within premarket hours."""
-        start_time = time.fromisoformat(self.config.premarket_start_time)
-        end_time = time.fromisoformat(self.config.premarket_end_time)
+        start_time = _parse_session_time(self.config.premarket_start_time)
+        end_time = _parse_session_time(self.config.premarket_end_time)
         return start_time <= current_time <= end_time
     
     def _is_market_open_time(self, current_time: time) -> bool:
         """Check if market is open."""
-        market_open = time.fromisoformat(self.config.premarket_end_time)
-        market_close = time.fromisoformat(self.config.market_close_time)
+        market_open = _parse_session_time(self.config.premarket_end_time)
+        market_close = _parse_session_time(self.config.market_close_time)
         return market_open <= current_time <= market_close
     
     def _finalize_premarket_scan(self) -> None:
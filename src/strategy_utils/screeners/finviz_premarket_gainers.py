@@ -6,80 +6,96 @@ https://finviz.com/screener.ashx?v=111&f=ta_gap_u10,sh_relvol_o5,sh_price_o2,sh_
 import pandas as pd
 from finvizfinance.screener.overview import Overview
 from finvizfinance.quote import finvizfinance
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime, timedelta
 import time
 from typing import List, Dict, Any
 
-def get_current_news(tickers: List[str], days_back: int = 2) -> Dict[str, Dict[str, Any]]:
+def _get_ticker_news(ticker: str, cutoff_day: datetime) -> Dict[str, Any]:
+    """
+    Fetch finviz news for a single ticker and keep items newer than the cutoff
+    
+    Args:
+        ticker (str): Stock ticker to check
+        cutoff_day (datetime): Oldest news date (midnight) to keep
+    
+    Returns:
+        Dict[str, Any]: Format: {'has_news': bool, 'news_titles': List[str]}
+    """
+    try:
+        current_stock = finvizfinance(ticker)
+        
+        # Add small delay to avoid rate limiting
+        time.sleep(0.5)
+        
+        # Get news data for specific ticker
+        news_df = current_stock.ticker_news()
+        
+        if news_df is not None and not news_df.empty:
+            # Filter news by date (within last X days) with a single vectorized mask
+            raw_dates = news_df.get('Date', pd.Series('', index=news_df.index))
+            has_date = raw_dates.notna() & (raw_dates.astype(str) != '')
+            
+            if pd.api.types.is_datetime64_any_dtype(raw_dates):
+                news_dates = raw_dates
+            else:
+                # finviz date format is typically "MMM-DD-YY HH:MM[AM/PM]"
+                news_dates = pd.to_datetime(
+                    raw_dates.astype(str).str.split().str[0],
+                    format='%b-%d-%y',
+                    errors='coerce'
+                )
+            
+            # If date parsing fails, include the news item to be safe
+            recent_mask = has_date & (news_dates.isna() | (news_dates >= cutoff_day))
+            recent_news = news_df[recent_mask]
+            news_titles = (
+                recent_news['Title'].fillna('No title available').tolist()
+                if 'Title' in recent_news else ['No title available'] * len(recent_news)
+            )
+            
+            has_news = len(recent_news) > 0
+            print(f"{ticker}: {'✓' if has_news else '✗'} ({'Found' if has_news else 'No'} recent news)")
+            
+            return {
+                'has_news': has_news,
+                'news_titles': news_titles[:3]  # Limit to first 3 news items
+            }
+        
+        print(f"{ticker}: ✗ (No news data available)")
+        
+    except Exception as e:
+        print(f"Error getting news for {ticker}: {e}")
+    
+    return {
+        'has_news': False,
+        'news_titles': []
+    }
+
+
+def get_current_news(tickers: List[str], days_back: int = 2,
+                     max_workers: int = 4) -> Dict[str, Dict[str, Any]]:
     """
     Check for recent news for given tickers within specified days
     
     Args:
         tickers (List[str]): List of stock tickers to check
         days_back (int): Number of days to look back for news (default: 2)
+        max_workers (int): Number of concurrent finviz requests (default: 4)
     
     Returns:
         Dict[str, Dict[str, Any]]: Dictionary with ticker as key and news info as value
                                    Format: {ticker: {'has_news': bool, 'news_titles': List[str]}}
     """
-    news_results = {}
     cutoff_date = datetime.now() - timedelta(days=days_back)
+    cutoff_day = cutoff_date.replace(hour=0, minute=0, second=0, microsecond=0)
     
     print(f"Checking news for {len(tickers)} tickers within last {days_back} days...")
     
-    
-    for ticker in tickers:
-        try:
-            current_stock = finvizfinance(ticker)
-            
-            # Add small delay to avoid rate limiting
-            time.sleep(0.5)
-            
-            # Get news data for specific ticker
-            news_df = current_stock.ticker_news()
-            
-            if news_df is not None and not news_df.empty:
-                # Filter news by date (within last X days)
-                recent_news = []
-                news_titles = []
-                
-                for idx, row in news_df.iterrows():
-                    try:
-                        # Parse the date from finviz format
-                        news_date_str = row.get('Date', '')
-                        if news_date_str:
-                            # finviz date format is typically "MMM-DD-YY HH:MM[AM/PM]"
-                            news_date = datetime.strptime(news_date_str.split()[0], '%b-%d-%y')
-                            
-                            if news_date >= cutoff_date.replace(hour=0, minute=0, second=0, microsecond=0):
-                                recent_news.append(row)
-                                news_titles.append(row.get('Title', 'No title available'))
-                    except:
-                        # If date parsing fails, include the news item to be safe
-                        recent_news.append(row)
-                        news_titles.append(row.get('Title', 'No title available'))
-                
-                has_news = len(recent_news) > 0
-                news_results[ticker] = {
-                    'has_news': has_news,
-                    'news_titles': news_titles[:3]  # Limit to first 3 news items
-                }
-                
-                print(f"{ticker}: {'✓' if has_news else '✗'} ({'Found' if has_news else 'No'} recent news)")
-                
-            else:
-                news_results[ticker] = {
-                    'has_news': False,
-                    'news_titles': []
-                }
-                print(f"{ticker}: ✗ (No news data available)")
-                
-        except Exception as e:
-            print(f"Error getting news for {ticker}: {e}")
-            news_results[ticker] = {
-                'has_news': False,
-                'news_titles': []
-            }
+    # finvizfinance is blocking, so overlap the requests on a small bounded pool
+    with ThreadPoolExecutor(max_workers=max_workers) as executor:
+        results = executor.map(lambda ticker: _get_ticker_news(ticker, cutoff_day), tickers)
+        news_results = dict(zip(tickers, results))
     
     return news_results
 
@@ -127,13 +143,10 @@ def get_current_gainers() -> pd.DataFrame:
             # Get news for filtered tickers
             news_results = get_current_news(tickers, days_back=2)
             
-            # Add news information to the dataframe
-            df['has_recent_news'] = df['Ticker'].map(
-                lambda x: news_results.get(x, {}).get('has_news', False)
-            )
-            df['recent_news_titles'] = df['Ticker'].map(
-                lambda x: ' | '.join(news_results.get(x, {}).get('news_titles', []))
-            )
+            # Add news information to the dataframe as whole columns aligned with the rows
+            ticker_news = [news_results[ticker] for ticker in tickers]
+            df['has_recent_news'] = [news['has_news'] for news in ticker_news]
+            df['recent_news_titles'] = [' | '.join(news['news_titles']) for news in ticker_news]
             
             return df
         else:
@@ -153,19 +166,19 @@ if __name__ == "__main__":
     if not result_df.empty:
         print(f"\n=== SCREENING RESULTS ===")
         print(f"Total stocks found: {len(result_df)}")
-        print(f"Stocks with recent news: {sum(result_df['has_recent_news'])}")
+        print(f"Stocks with recent news: {int(result_df['has_recent_news'].sum())}")
         print(f"\nDetailed Results:")
         print("-" * 80)
         
         # Print each stock with its info
-        for _, row in result_df.iterrows():
-            print(f"Ticker: {row['Ticker']}")
-            print(f"Company: {row.get('Company', 'N/A')}")
-            print(f"Price: ${row.get('Price', 'N/A')}")
-            print(f"Change: {row.get('Change', 'N/A')}")
-            print(f"Has Recent News: {row['has_recent_news']}")
-            if row['recent_news_titles']:
-                print(f"News Titles: {row['recent_news_titles'][:200]}...")
+        for row in result_df.itertuples(index=False):
+            print(f"Ticker: {row.Ticker}")
+            print(f"Company: {getattr(row, 'Company', 'N/A')}")
+            print(f"Price: ${getattr(row, 'Price', 'N/A')}")
+            print(f"Change: {getattr(row, 'Change', 'N/A')}")
+            print(f"Has Recent News: {row.has_recent_news}")
+            if row.recent_news_titles:
+                print(f"News Titles: {row.recent_news_titles[:200]}...")
             print("-" * 40)
     else:
         print("No results to display")
\ No newline at end of file